@@ -15,13 +15,22 @@ This module demonstrates how backend systems can handle regulatory
 compliance requirements, which is crucial for enterprise applications.
 """
 
+import heapq
 import json
 import logging
-from datetime import datetime, timedelta
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import itemgetter
+
+try:
+    import orjson  # Optional: faster JSON serialization for report export
+except ImportError:
+    orjson = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -34,6 +43,12 @@ class ComplianceStatus(Enum):
     NOT_APPLICABLE = "NOT_APPLICABLE"
     PENDING_REVIEW = "PENDING_REVIEW"
 
+# Serialized status strings, resolved once instead of via .value per assessment
+_STATUS_VALUES = {status: status.value for status in ComplianceStatus}
+
+# Integer code per status, used for columnar (NumPy) status histograms
+_STATUS_INDEX = {status: index for index, status in enumerate(ComplianceStatus)}
+
 class RegulatoryFramework(Enum):
     """Regulatory frameworks applicable to solar inverters in SA."""
     AEMO_VPP = "AEMO_VPP"                    # AEMO Virtual Power Plant requirements
@@ -96,7 +111,7 @@ class ComplianceAssessment:
         """Convert assessment to dictionary."""
         return {
             "requirement_id": self.requirement_id,
-            "status": self.status.value,
+            "status": _STATUS_VALUES[self.status],
             "compliance_score": self.compliance_score,
             "assessment_date": self.assessment_date.isoformat(),
             "evidence": self.evidence,
@@ -689,15 +704,19 @@ class RegulatoryCompliance:
         """
         logger.info("Starting comprehensive regulatory compliance analysis")
         
-        # Analyze AEMO VPP compliance
-        logger.info("Analyzing AEMO VPP compliance...")
-        aemo_assessments = self.aemo_analyzer.assess_aemo_compliance(self.system_config)
-        self.compliance_results["AEMO_VPP"] = aemo_assessments
+        # Frameworks are assessed independently over the same configuration,
+        # so fan them out and collect results in declaration order
+        analyzers = [
+            ("AEMO_VPP", self.aemo_analyzer.assess_aemo_compliance),
+            ("AS4777", self.as4777_analyzer.assess_as4777_compliance)
+        ]
         
-        # Analyze AS4777 compliance
-        logger.info("Analyzing AS4777 compliance...")
-        as4777_assessments = self.as4777_analyzer.assess_as4777_compliance(self.system_config)
-        self.compliance_results["AS4777"] = as4777_assessments
+        logger.info(f"Analyzing {', '.join(name for name, _ in analyzers)} compliance...")
+        with ThreadPoolExecutor(max_workers=len(analyzers)) as executor:
+            futures = {name: executor.submit(assess, self.system_config)
+                       for name, assess in analyzers}
+            for name, future in futures.items():
+                self.compliance_results[name] = future.result()
         
         # Generate summary analysis
         summary = self._generate_compliance_summary()
@@ -707,7 +726,7 @@ class RegulatoryCompliance:
         
         # Compile comprehensive results
         results = {
-            "analysis_timestamp": datetime.now().isoformat(),
+            "analysis_timestamp": datetime.now(timezone.utc).isoformat(timespec='seconds'),
             "system_info": {
                 "name": self.system_config.get("system_name", "Unknown"),
                 "location": self.system_config.get("location", "Unknown"),
@@ -738,28 +757,34 @@ class RegulatoryCompliance:
             "framework_summaries": {}
         }
         
-        all_scores = []
+        total_score = 0.0
         total_requirements = 0
-        status_counts = {status: 0 for status in ComplianceStatus}
+        status_totals = np.zeros(len(_STATUS_INDEX), dtype=np.int64)
         
         for framework, assessments in self.compliance_results.items():
-            framework_scores = [assessment.compliance_score for assessment in assessments]
-            framework_avg = sum(framework_scores) / len(framework_scores) if framework_scores else 0
+            # Columnar view of the framework's assessments
+            count = len(assessments)
+            scores = np.fromiter((a.compliance_score for a in assessments),
+                                 dtype=np.float64, count=count)
+            status_codes = np.fromiter((_STATUS_INDEX[a.status] for a in assessments),
+                                       dtype=np.int8, count=count)
+            framework_status_counts = np.bincount(status_codes, minlength=len(_STATUS_INDEX))
             
-            framework_status_counts = {status: 0 for status in ComplianceStatus}
-            for assessment in assessments:
-                framework_status_counts[assessment.status] += 1
-                status_counts[assessment.status] += 1
+            framework_score = float(scores.sum())
+            framework_avg = framework_score / count if count else 0
             
             summary["framework_summaries"][framework] = {
-                "requirements_count": len(assessments),
+                "requirements_count": count,
                 "average_score": round(framework_avg, 2),
-                "status_distribution": {status.value: count 
-                                     for status, count in framework_status_counts.items()}
+                "status_distribution": dict(zip(_STATUS_VALUES.values(),
+                                                framework_status_counts.tolist()))
             }
             
-            all_scores.extend(framework_scores)
-            total_requirements += len(assessments)
+            status_totals += framework_status_counts
+            total_score += framework_score
+            total_requirements += count
+        
+        status_counts = dict(zip(ComplianceStatus, status_totals.tolist()))
         
         # Calculate overall metrics
         summary["total_requirements"] = total_requirements
@@ -767,17 +792,14 @@ class RegulatoryCompliance:
         summary["non_compliant_requirements"] = status_counts[ComplianceStatus.NON_COMPLIANT]
         summary["partially_compliant_requirements"] = status_counts[ComplianceStatus.PARTIALLY_COMPLIANT]
         
-        if all_scores:
-            summary["average_compliance_score"] = round(sum(all_scores) / len(all_scores), 2)
+        if total_requirements:
+            summary["average_compliance_score"] = round(total_score / total_requirements, 2)
         
         # Determine overall status
-        if status_counts[ComplianceStatus.NON_COMPLIANT] == 0:
-            if status_counts[ComplianceStatus.PARTIALLY_COMPLIANT] == 0:
-                summary["overall_status"] = ComplianceStatus.COMPLIANT.value
-            else:
-                summary["overall_status"] = ComplianceStatus.PARTIALLY_COMPLIANT.value
-        else:
-            summary["overall_status"] = ComplianceStatus.NON_COMPLIANT.value
+        overall_status = (ComplianceStatus.NON_COMPLIANT if status_counts[ComplianceStatus.NON_COMPLIANT]
+                          else ComplianceStatus.PARTIALLY_COMPLIANT if status_counts[ComplianceStatus.PARTIALLY_COMPLIANT]
+                          else ComplianceStatus.COMPLIANT)
+        summary["overall_status"] = _STATUS_VALUES[overall_status]
         
         return summary
     
@@ -785,39 +807,35 @@ class RegulatoryCompliance:
         """Generate prioritized compliance recommendations."""
         recommendations = []
         
-        # Collect all gaps and recommendations
-        all_gaps = []
+        # Collect all recommendations
         all_recommendations = []
         
         for framework, assessments in self.compliance_results.items():
             for assessment in assessments:
-                for gap in assessment.gaps_identified:
-                    all_gaps.append({
-                        "framework": framework,
-                        "requirement": assessment.requirement_id,
-                        "gap": gap,
-                        "compliance_score": assessment.compliance_score
-                    })
+                requirement_id = assessment.requirement_id
+                compliance_score = assessment.compliance_score
                 
                 for rec in assessment.recommendations:
                     all_recommendations.append({
                         "framework": framework,
-                        "requirement": assessment.requirement_id,
+                        "requirement": requirement_id,
                         "recommendation": rec,
-                        "compliance_score": assessment.compliance_score
+                        "compliance_score": compliance_score
                     })
         
-        # Prioritize recommendations based on compliance scores (lowest first)
-        all_recommendations.sort(key=lambda x: x["compliance_score"])
+        # Prioritize recommendations based on compliance scores (lowest first);
+        # only the top five are reported, so avoid sorting the full list
+        top_recommendations = heapq.nsmallest(5, all_recommendations,
+                                              key=itemgetter("compliance_score"))
         
         # Generate high-level recommendations
-        if all_recommendations:
+        if top_recommendations:
             priority_recommendations = [
                 {
                     "priority": "HIGH",
                     "category": "Immediate Compliance Actions",
                     "description": "Address critical compliance gaps to avoid penalties",
-                    "actions": [rec["recommendation"] for rec in all_recommendations[:5]]
+                    "actions": list(map(itemgetter("recommendation"), top_recommendations))
                 },
                 {
                     "priority": "MEDIUM", 
@@ -887,15 +905,29 @@ class RegulatoryCompliance:
         
         return context
     
-    def export_compliance_report(self, output_path: str = "outputs/regulatory_compliance_report.json") -> None:
-        """Export compliance analysis report."""
+    def export_compliance_report(self, output_path: str = "outputs/regulatory_compliance_report.json",
+                                 pretty: bool = False) -> None:
+        """
+        Export compliance analysis report.
+        
+        Args:
+            output_path: Destination JSON file
+            pretty: Indent the output for human reading (compact by default)
+        """
         results = self.run_comprehensive_compliance_analysis()
         
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            output_file.write_bytes(orjson.dumps(results, option=option))
+        else:
+            with open(output_file, 'w') as f:
+                if pretty:
+                    json.dump(results, f, indent=2)
+                else:
+                    json.dump(results, f, separators=(',', ':'))
         
         logger.info(f"Regulatory compliance report exported to {output_path}")
 
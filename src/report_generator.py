@@ -17,21 +17,41 @@ suitable for different stakeholder audiences.
 
 import json
 import logging
+import os
+import weakref
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 import base64
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from jinja2 import Template, Environment, FileSystemLoader
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
-import numpy as np
+from jinja2 import Template, Environment, FileSystemLoader, TemplateNotFound
 from io import BytesIO
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# The plotting stack is imported on first use so that callers who only need
+# analysis results (or import a sibling module via the package) don't pay
+# for matplotlib/seaborn start-up.
+@lru_cache(maxsize=None)
+def _pyplot():
+    """Import pyplot on first use; the configured backend is left untouched."""
+    import matplotlib.pyplot as plt
+    return plt
+
+@lru_cache(maxsize=None)
+def _seaborn():
+    """Import seaborn on first use."""
+    import seaborn as sns
+    return sns
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """Import numpy on first use."""
+    import numpy as np
+    return np
+
 @dataclass
 class ReportConfiguration:
     """Configuration for report generation."""
@@ -45,6 +65,88 @@ class ReportConfiguration:
     include_recommendations: bool = True
     output_format: str = "html"  # html, pdf, markdown
     
+DREAD_COMPONENTS = ["damage", "reproducibility", "exploitability", "affected_users", "discoverability"]
+
+def _severity_counts(vulnerability_data: Dict[str, Any]) -> Dict[str, int]:
+    """Count vulnerabilities per severity level."""
+    return {
+        "Critical": len(vulnerability_data.get("critical_vulnerabilities", [])),
+        "High": len(vulnerability_data.get("high_vulnerabilities", [])),
+        "Medium": len(vulnerability_data.get("medium_vulnerabilities", [])),
+        "Low": len(vulnerability_data.get("low_vulnerabilities", []))
+    }
+
+def _stride_counts(stride_data: Dict[str, Any]) -> List[Tuple[str, int]]:
+    """Extract (category, threat count) pairs from the STRIDE breakdown."""
+    return list(stride_data.get("stride_breakdown", {}).items())
+
+def _dread_matrix(dread_data: Dict[str, Any]) -> Tuple[List[str], Any]:
+    """Extract labels and the DREAD component matrix for the top 10 threats."""
+    np = _numpy()
+    threats = dread_data.get("detailed_scores", [])[:10]
+    
+    threat_names = [threat.get("threat_id", "")[:20] + "..." if len(threat.get("threat_id", "")) > 20
+                    else threat.get("threat_id", "") for threat in threats]
+    matrix_data = np.array([[threat.get(component, 0) for component in DREAD_COMPONENTS]
+                            for threat in threats], dtype=float)
+    return threat_names, matrix_data
+
+def _economic_impacts(economic_data: Dict[str, Any]) -> List[Tuple[str, float]]:
+    """Extract (scenario label, total impact) pairs."""
+    return [(scenario_name.replace('_', ' ').title(), scenario_data.get("total_economic_impact", 0))
+            for scenario_name, scenario_data in economic_data.get("scenario_analysis", {}).items()]
+
+def _compliance_scores(compliance_data: Dict[str, Any]) -> List[Tuple[str, float]]:
+    """Extract (framework label, average compliance score) pairs."""
+    scores = []
+    for framework, assessments in compliance_data.get("framework_results", {}).items():
+        if assessments:
+            avg_score = sum(assessment.get("compliance_score", 0) for assessment in assessments) / len(assessments)
+        else:
+            avg_score = 0
+        scores.append((framework.replace('_', ' '), avg_score))
+    return scores
+
+def _extract_chart_data(extractor, section_data: Any, chart_name: str) -> Optional[Any]:
+    """Run a chart data extractor, returning None if the section is malformed."""
+    try:
+        return extractor(section_data)
+    except Exception as e:
+        logger.error(f"Error extracting {chart_name} data: {e}")
+        return None
+
+@dataclass
+class ChartInputs:
+    """
+    Chart-ready values extracted once from the combined report data.
+
+    Fields whose report section could not be extracted are None; only the
+    charts drawn from those fields are left blank.
+    """
+    severity_counts: Optional[Dict[str, int]]
+    stride_counts: Optional[List[Tuple[str, int]]]
+    dread_threat_names: Optional[List[str]]
+    dread_matrix: Any  # numpy array, threats x DREAD_COMPONENTS
+    economic_impacts: Optional[List[Tuple[str, float]]]
+    compliance_scores: Optional[List[Tuple[str, float]]]
+    
+    @classmethod
+    def from_report_data(cls, data: Dict[str, Any]) -> 'ChartInputs':
+        """Normalize the per-framework report sections into chart inputs."""
+        dread = _extract_chart_data(_dread_matrix, data.get("dread", {}), "risk heat map")
+        dread_threat_names, dread_matrix = dread if dread is not None else (None, None)
+        return cls(
+            severity_counts=_extract_chart_data(_severity_counts, data.get("vulnerabilities", {}),
+                                                "vulnerability severity chart"),
+            stride_counts=_extract_chart_data(_stride_counts, data.get("stride", {}), "STRIDE matrix"),
+            dread_threat_names=dread_threat_names,
+            dread_matrix=dread_matrix,
+            economic_impacts=_extract_chart_data(_economic_impacts, data.get("economic", {}),
+                                                 "economic impact chart"),
+            compliance_scores=_extract_chart_data(_compliance_scores, data.get("compliance", {}),
+                                                  "compliance radar chart")
+        )
+
 class VisualizationGenerator:
     """
     Generates visualizations for cybersecurity analysis reports.
@@ -55,22 +157,54 @@ class VisualizationGenerator:
     
     def __init__(self):
         # Set visualization style
+        plt = _pyplot()
         plt.style.use('default')
-        sns.set_palette("husl")
+        _seaborn().set_palette("husl")
+        
+        # A single figure is reused for every chart; it is detached from
+        # pyplot so it never needs closing and no GUI manager is created
+        self._fig = plt.Figure(figsize=(12, 8))
+        
+        # Tight layout is applied by the figure at draw time, which avoids the
+        # extra render pass that savefig(bbox_inches='tight') performs
+        self._fig.set_layout_engine('tight')
+    
+    def _new_axes(self, figsize, **subplot_kw):
+        """Reset the shared figure to the given size and return fresh axes."""
+        self._fig.clf()
+        self._fig.set_size_inches(figsize)
+        return self._fig, self._fig.add_subplot(**subplot_kw)
     
     def create_vulnerability_severity_chart(self, vulnerability_data: Dict[str, Any]) -> str:
         """Create vulnerability severity distribution chart."""
+        severity_counts = _extract_chart_data(_severity_counts, vulnerability_data, "vulnerability severity chart")
+        return "" if severity_counts is None else self._plot_vulnerability_severity(severity_counts)
+    
+    def create_stride_threat_matrix(self, stride_data: Dict[str, Any]) -> str:
+        """Create STRIDE threat category matrix visualization."""
+        stride_counts = _extract_chart_data(_stride_counts, stride_data, "STRIDE matrix")
+        return "" if stride_counts is None else self._plot_stride_threat_matrix(stride_counts)
+    
+    def create_risk_heat_map(self, dread_data: Dict[str, Any]) -> str:
+        """Create risk heat map based on DREAD scores."""
+        dread = _extract_chart_data(_dread_matrix, dread_data, "risk heat map")
+        return "" if dread is None else self._plot_risk_heat_map(*dread)
+    
+    def create_economic_impact_chart(self, economic_data: Dict[str, Any]) -> str:
+        """Create economic impact analysis chart."""
+        economic_impacts = _extract_chart_data(_economic_impacts, economic_data, "economic impact chart")
+        return "" if economic_impacts is None else self._plot_economic_impact(economic_impacts)
+    
+    def create_compliance_radar_chart(self, compliance_data: Dict[str, Any]) -> str:
+        """Create regulatory compliance radar chart."""
+        compliance_scores = _extract_chart_data(_compliance_scores, compliance_data, "compliance radar chart")
+        return "" if compliance_scores is None else self._plot_compliance_radar(compliance_scores)
+    
+    def _plot_vulnerability_severity(self, severity_counts: Dict[str, int]) -> str:
+        """Draw the severity pie chart from precomputed counts."""
         try:
-            # Extract severity data
-            severity_counts = {
-                "Critical": len(vulnerability_data.get("critical_vulnerabilities", [])),
-                "High": len(vulnerability_data.get("high_vulnerabilities", [])),
-                "Medium": len(vulnerability_data.get("medium_vulnerabilities", [])),
-                "Low": len(vulnerability_data.get("low_vulnerabilities", []))
-            }
-            
             # Create pie chart
-            fig, ax = plt.subplots(figsize=(10, 8))
+            fig, ax = self._new_axes((10, 8))
             colors = ['#ff4444', '#ff8800', '#ffdd00', '#44aa44']
             
             wedges, texts, autotexts = ax.pie(
@@ -88,8 +222,6 @@ class VisualizationGenerator:
                 autotext.set_color('white')
                 autotext.set_fontweight('bold')
             
-            plt.tight_layout()
-            
             # Convert to base64 string
             return self._fig_to_base64(fig)
             
@@ -97,17 +229,16 @@ class VisualizationGenerator:
             logger.error(f"Error creating vulnerability severity chart: {e}")
             return ""
     
-    def create_stride_threat_matrix(self, stride_data: Dict[str, Any]) -> str:
-        """Create STRIDE threat category matrix visualization."""
+    def _plot_stride_threat_matrix(self, stride_counts: List[Tuple[str, int]]) -> str:
+        """Draw the STRIDE category bar chart from precomputed counts."""
         try:
-            # Extract STRIDE breakdown data
-            stride_breakdown = stride_data.get("stride_breakdown", {})
-            
-            categories = list(stride_breakdown.keys())
-            counts = list(stride_breakdown.values())
+            sns = _seaborn()
+
+            categories = [category for category, _ in stride_counts]
+            counts = [count for _, count in stride_counts]
             
             # Create horizontal bar chart
-            fig, ax = plt.subplots(figsize=(12, 8))
+            fig, ax = self._new_axes((12, 8))
             
             bars = ax.barh(categories, counts, color=sns.color_palette("viridis", len(categories)))
             
@@ -119,79 +250,58 @@ class VisualizationGenerator:
             ax.set_xlabel('Number of Threats', fontsize=12, fontweight='bold')
             ax.set_title('STRIDE Threat Category Distribution', fontsize=16, fontweight='bold')
             ax.grid(axis='x', alpha=0.3)
-            
-            plt.tight_layout()
             return self._fig_to_base64(fig)
             
         except Exception as e:
             logger.error(f"Error creating STRIDE matrix: {e}")
             return ""
     
-    def create_risk_heat_map(self, dread_data: Dict[str, Any]) -> str:
-        """Create risk heat map based on DREAD scores."""
+    def _plot_risk_heat_map(self, threat_names: List[str], matrix_data: Any) -> str:
+        """Draw the DREAD heat map from a precomputed threats x components matrix."""
         try:
-            # Extract threat data
-            threats = dread_data.get("detailed_scores", [])
-            
-            if not threats:
+            np = _numpy()
+
+            if not threat_names:
                 return ""
             
-            # Prepare data for heat map
-            threat_names = [threat["threat_id"][:20] + "..." if len(threat["threat_id"]) > 20 
-                          else threat["threat_id"] for threat in threats[:10]]  # Top 10 threats
-            
-            dread_components = ["damage", "reproducibility", "exploitability", "affected_users", "discoverability"]
-            
-            # Create matrix
-            matrix_data = []
-            for threat in threats[:10]:
-                row = [threat.get(component, 0) for component in dread_components]
-                matrix_data.append(row)
-            
             # Create heat map
-            fig, ax = plt.subplots(figsize=(12, 10))
+            fig, ax = self._new_axes((12, 10))
             
             im = ax.imshow(matrix_data, cmap='RdYlBu_r', aspect='auto', vmin=0, vmax=10)
             
             # Set ticks and labels
-            ax.set_xticks(range(len(dread_components)))
-            ax.set_xticklabels([comp.title() for comp in dread_components], rotation=45)
+            ax.set_xticks(range(len(DREAD_COMPONENTS)))
+            ax.set_xticklabels([comp.title() for comp in DREAD_COMPONENTS], rotation=45)
             ax.set_yticks(range(len(threat_names)))
             ax.set_yticklabels(threat_names)
             
             # Add colorbar
-            cbar = plt.colorbar(im, ax=ax)
+            cbar = fig.colorbar(im, ax=ax)
             cbar.set_label('DREAD Score (0-10)', rotation=270, labelpad=20)
             
             # Add text annotations
-            for i in range(len(threat_names)):
-                for j in range(len(dread_components)):
-                    text = ax.text(j, i, f'{matrix_data[i][j]:.0f}',
-                                 ha="center", va="center", color="white", fontweight='bold')
+            for (i, j), value in np.ndenumerate(matrix_data):
+                ax.text(j, i, f'{value:.0f}',
+                        ha="center", va="center", color="white", fontweight='bold')
             
             ax.set_title('DREAD Risk Assessment Heat Map', fontsize=16, fontweight='bold', pad=20)
-            
-            plt.tight_layout()
             return self._fig_to_base64(fig)
             
         except Exception as e:
             logger.error(f"Error creating risk heat map: {e}")
             return ""
     
-    def create_economic_impact_chart(self, economic_data: Dict[str, Any]) -> str:
-        """Create economic impact analysis chart."""
+    def _plot_economic_impact(self, economic_impacts: List[Tuple[str, float]]) -> str:
+        """Draw the economic impact bar chart from (scenario, impact) pairs."""
         try:
-            scenario_analysis = economic_data.get("scenario_analysis", {})
-            
-            scenarios = []
-            impacts = []
-            
-            for scenario_name, scenario_data in scenario_analysis.items():
-                scenarios.append(scenario_name.replace('_', ' ').title())
-                impacts.append(scenario_data.get("total_economic_impact", 0))
+            plt = _pyplot()
+            sns = _seaborn()
+
+            scenarios = [scenario for scenario, _ in economic_impacts]
+            impacts = [impact for _, impact in economic_impacts]
             
             # Create bar chart
-            fig, ax = plt.subplots(figsize=(14, 8))
+            fig, ax = self._new_axes((14, 8))
             
             bars = ax.bar(range(len(scenarios)), impacts, 
                          color=sns.color_palette("rocket", len(scenarios)))
@@ -210,10 +320,10 @@ class VisualizationGenerator:
             ax.set_title('Economic Impact by Cyberattack Scenario', fontsize=16, fontweight='bold')
             
             # Rotate x-axis labels for better readability
-            plt.xticks(range(len(scenarios)), scenarios, rotation=45, ha='right')
+            ax.set_xticks(range(len(scenarios)))
+            ax.set_xticklabels(scenarios, rotation=45, ha='right')
             
             ax.grid(axis='y', alpha=0.3)
-            plt.tight_layout()
             
             return self._fig_to_base64(fig)
             
@@ -221,28 +331,19 @@ class VisualizationGenerator:
             logger.error(f"Error creating economic impact chart: {e}")
             return ""
     
-    def create_compliance_radar_chart(self, compliance_data: Dict[str, Any]) -> str:
-        """Create regulatory compliance radar chart."""
+    def _plot_compliance_radar(self, compliance_scores: List[Tuple[str, float]]) -> str:
+        """Draw the compliance radar chart from (framework, average score) pairs."""
         try:
-            framework_results = compliance_data.get("framework_results", {})
-            
-            frameworks = []
-            scores = []
-            
-            for framework, assessments in framework_results.items():
-                frameworks.append(framework.replace('_', ' '))
-                # Calculate average compliance score for framework
-                if assessments:
-                    avg_score = sum(assessment["compliance_score"] for assessment in assessments) / len(assessments)
-                    scores.append(avg_score)
-                else:
-                    scores.append(0)
-            
-            if not frameworks:
+            np = _numpy()
+
+            if not compliance_scores:
                 return ""
             
+            frameworks = [framework for framework, _ in compliance_scores]
+            scores = [score for _, score in compliance_scores]
+            
             # Create radar chart
-            fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
+            fig, ax = self._new_axes((10, 10), projection='polar')
             
             # Calculate angles for each framework
             angles = np.linspace(0, 2 * np.pi, len(frameworks), endpoint=False)
@@ -266,8 +367,6 @@ class VisualizationGenerator:
             
             ax.set_title('Regulatory Compliance Assessment', fontsize=16, fontweight='bold', pad=20)
             ax.grid(True)
-            
-            plt.tight_layout()
             return self._fig_to_base64(fig)
             
         except Exception as e:
@@ -275,103 +374,113 @@ class VisualizationGenerator:
             return ""
     
     def _fig_to_base64(self, fig) -> str:
-        """Convert matplotlib figure to base64 string."""
+        """Convert matplotlib figure to base64 string and clear it for reuse."""
         try:
             buffer = BytesIO()
-            fig.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
+            fig.savefig(buffer, format='png', dpi=150)
             buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-            plt.close(fig)
-            return image_base64
+            return base64.b64encode(buffer.getvalue()).decode('utf-8')
         except Exception as e:
             logger.error(f"Error converting figure to base64: {e}")
-            plt.close(fig)
             return ""
+        finally:
+            fig.clf()
+
+FALLBACK_HTML_TEMPLATE = """
+<html>
+<head><title>{{ report_title }}</title></head>
+<body>
+    <h1>{{ report_title }}</h1>
+    <h2>Author: {{ author }}</h2>
+    <h3>Organization: {{ organization }}</h3>
+    <p><strong>Classification:</strong> {{ classification }}</p>
+    {% if executive_summary %}
+    <h2>Executive Summary</h2>
+    <p>{{ executive_summary }}</p>
+    {% endif %}
+    {% if technical_details %}
+    <h2>Technical Details</h2>
+    <p>{{ technical_details }}</p>
+    {% endif %}
+    {% if visualizations %}
+    <h2>Visualizations</h2>
+    {% for viz_title, viz_image in visualizations.items() %}
+    <h3>{{ viz_title }}</h3>
+    <img src="data:image/png;base64,{{ viz_image }}" alt="{{ viz_title }}" />
+    {% endfor %}
+    {% endif %}
+    {% if recommendations %}
+    <h2>Recommendations</h2>
+    <ul>
+        {% for rec in recommendations %}<li>{{ rec }}</li>{% endfor %}
+    </ul>
+    {% endif %}
+</body>
+</html>
+"""
+
+# Report charts as (title, VisualizationGenerator plot method, ChartInputs fields)
+REPORT_CHARTS = [
+    ("Vulnerability Severity", "_plot_vulnerability_severity", ("severity_counts",)),
+    ("STRIDE Threat Matrix", "_plot_stride_threat_matrix", ("stride_counts",)),
+    ("DREAD Risk Heat Map", "_plot_risk_heat_map", ("dread_threat_names", "dread_matrix")),
+    ("Economic Impact", "_plot_economic_impact", ("economic_impacts",)),
+    ("Compliance Radar", "_plot_compliance_radar", ("compliance_scores",))
+]
+
+@lru_cache(maxsize=None)
+def _worker_viz_generator() -> VisualizationGenerator:
+    """Visualization generator shared by all charts rendered in this process."""
+    return VisualizationGenerator()
+
+def _render_chart(method_name: str, chart_args: Tuple[Any, ...]) -> str:
+    """Render a single chart; module level so it can run in a worker process."""
+    return getattr(_worker_viz_generator(), method_name)(*chart_args)
 
 class HTMLReportBuilder:
     """
     Builds comprehensive HTML reports with embedded visualizations.
 
     This class creates professional-looking HTML reports suitable
-    for executive and technical audiences.
+    for executive and technical audiences. Use it as a context manager, or
+    call close(), to stop the chart worker processes once done; they are
+    also stopped when the builder is garbage collected.
     """
 
     def __init__(self):
         self.viz_generator = VisualizationGenerator()
         self.template_env = self._setup_template_environment()
+        # Compiled once and kept in memory; never written to disk
+        self._fallback_template = self.template_env.from_string(FALLBACK_HTML_TEMPLATE)
+        self._template = self._load_report_template()
+        # Chart worker pool, started on first use and reused across reports
+        self._chart_executor: Optional[ProcessPoolExecutor] = None
+        self._chart_executor_finalizer: Optional[weakref.finalize] = None
+
+    def __enter__(self) -> 'HTMLReportBuilder':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def _setup_template_environment(self) -> Environment:
         """Setup Jinja2 template environment."""
-        # Create templates directory if it doesn't exist
-        templates_dir = Path("templates")
-        templates_dir.mkdir(exist_ok=True)
+        # Load templates from directory (a missing directory simply yields
+        # TemplateNotFound, handled in build_report)
+        return Environment(loader=FileSystemLoader("templates"), autoescape=True)
 
-        # Load templates from directory
-        return Environment(loader=FileSystemLoader(str(templates_dir)), autoescape=True)
+    def _load_report_template(self) -> Template:
+        """Compile the report template once, falling back to the built-in one."""
+        try:
+            return self.template_env.get_template("report_template.html")
+        except TemplateNotFound:
+            logger.warning("Default template not found. Using fallback template.")
+            return self._fallback_template
 
     def build_report(self, config: ReportConfiguration, data: Dict[str, Any]) -> str:
         """Generate an HTML report from data and config."""
         try:
-            template_path = Path("templates/report_template.html")
-            if not template_path.exists():
-                logger.warning("Default template not found. Creating fallback template.")
-                template_content = """
-                <html>
-                <head><title>{{ report_title }}</title></head>
-                <body>
-                    <h1>{{ report_title }}</h1>
-                    <h2>Author: {{ author }}</h2>
-                    <h3>Organization: {{ organization }}</h3>
-                    <p><strong>Classification:</strong> {{ classification }}</p>
-                    {% if executive_summary %}
-                    <h2>Executive Summary</h2>
-                    <p>{{ executive_summary }}</p>
-                    {% endif %}
-                    {% if technical_details %}
-                    <h2>Technical Details</h2>
-                    <p>{{ technical_details }}</p>
-                    {% endif %}
-                    {% if visualizations %}
-                    <h2>Visualizations</h2>
-                    {% for viz_title, viz_image in visualizations.items() %}
-                    <h3>{{ viz_title }}</h3>
-                    <img src="data:image/png;base64,{{ viz_image }}" alt="{{ viz_title }}" />
-                    {% endfor %}
-                    {% endif %}
-                    {% if recommendations %}
-                    <h2>Recommendations</h2>
-                    <ul>
-                        {% for rec in recommendations %}<li>{{ rec }}</li>{% endfor %}
-                    </ul>
-                    {% endif %}
-                </body>
-                </html>
-                """
-                with open(template_path, 'w') as f:
-                    f.write(template_content)
-
-            template = self.template_env.get_template("report_template.html")
-
-            visualizations = {}
-            if config.include_visualizations:
-                visualizations = {
-                    "Vulnerability Severity": self.viz_generator.create_vulnerability_severity_chart(data.get("vulnerabilities", {})),
-                    "STRIDE Threat Matrix": self.viz_generator.create_stride_threat_matrix(data.get("stride", {})),
-                    "DREAD Risk Heat Map": self.viz_generator.create_risk_heat_map(data.get("dread", {})),
-                    "Economic Impact": self.viz_generator.create_economic_impact_chart(data.get("economic", {})),
-                    "Compliance Radar": self.viz_generator.create_compliance_radar_chart(data.get("compliance", {}))
-                }
-
-            report_html = template.render(
-                report_title=config.report_title,
-                organization=config.organization,
-                author=config.author,
-                classification=config.classification,
-                executive_summary=data.get("executive_summary") if config.include_executive_summary else None,
-                technical_details=data.get("technical_details") if config.include_technical_details else None,
-                visualizations=visualizations,
-                recommendations=data.get("recommendations") if config.include_recommendations else None
-            )
+            report_html = self._template.render(**self._template_context(config, data))
 
             return report_html
 
@@ -379,6 +488,88 @@ class HTMLReportBuilder:
             logger.error(f"Error building HTML report: {e}")
             return "<p>Error generating report</p>"
 
+    def iter_report(self, config: ReportConfiguration, data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Generate an HTML report from data and config as a stream of chunks.
+
+        Yields the same document as build_report without holding the whole
+        rendered string in memory.
+        """
+        try:
+            yield from self._template.generate(**self._template_context(config, data))
+        except Exception as e:
+            logger.error(f"Error building HTML report: {e}")
+            yield "<p>Error generating report</p>"
+
+    def _template_context(self, config: ReportConfiguration, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect the template variables for a report."""
+        visualizations = {}
+        if config.include_visualizations:
+            visualizations = self._render_visualizations(data)
+
+        return dict(
+            report_title=config.report_title,
+            organization=config.organization,
+            author=config.author,
+            classification=config.classification,
+            executive_summary=data.get("executive_summary") if config.include_executive_summary else None,
+            technical_details=data.get("technical_details") if config.include_technical_details else None,
+            visualizations=visualizations,
+            recommendations=data.get("recommendations") if config.include_recommendations else None
+        )
+
+    def _render_visualizations(self, data: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Render all report charts.
+
+        Chart rendering is CPU-bound and the charts are independent, so on
+        multi-core machines they are rendered in a process pool shared by all
+        reports from this builder. With a single CPU, or if worker processes
+        are unavailable, the charts are rendered in this process instead.
+        """
+        chart_inputs = ChartInputs.from_report_data(data)
+        # Every chart keeps its slot (and order); charts whose section data
+        # was malformed stay blank
+        visualizations = {title: "" for title, _, _ in REPORT_CHARTS}
+        jobs = []
+        for title, method_name, fields in REPORT_CHARTS:
+            chart_args = tuple(getattr(chart_inputs, name) for name in fields)
+            if all(arg is not None for arg in chart_args):
+                jobs.append((title, method_name, chart_args))
+
+        executor = self._chart_pool() if len(jobs) > 1 else None
+        if executor is not None:
+            try:
+                futures = {title: executor.submit(_render_chart, method_name, chart_args)
+                           for title, method_name, chart_args in jobs}
+                visualizations.update((title, future.result()) for title, future in futures.items())
+                return visualizations
+            except Exception as e:
+                logger.warning(f"Parallel chart rendering unavailable, rendering sequentially: {e}")
+                self.close()
+
+        visualizations.update((title, getattr(self.viz_generator, method_name)(*chart_args))
+                              for title, method_name, chart_args in jobs)
+        return visualizations
+
+    def _chart_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Return the shared chart worker pool, or None when only one CPU is available."""
+        if self._chart_executor is None:
+            max_workers = min(len(REPORT_CHARTS), os.cpu_count() or 1)
+            if max_workers <= 1:
+                return None
+            self._chart_executor = ProcessPoolExecutor(max_workers=max_workers)
+            # Stop the workers if the builder is discarded without close()
+            self._chart_executor_finalizer = weakref.finalize(self, self._chart_executor.shutdown)
+        return self._chart_executor
+
+    def close(self) -> None:
+        """Shut down the chart worker pool, if one was started."""
+        if self._chart_executor is not None:
+            self._chart_executor_finalizer()
+            self._chart_executor = None
+            self._chart_executor_finalizer = None
+
 class ReportGenerator:
     """
     Main report generation engine. Wraps HTMLReportBuilder and provides a simple interface.
@@ -394,7 +585,25 @@ class ReportGenerator:
         else:
             raise NotImplementedError(f"Output format {self.output_format} not supported yet.")
 
+    def iter_report(self, config: ReportConfiguration, data: Dict[str, Any]) -> Iterator[str]:
+        """Yield the report in chunks; joined, they equal generate_report's output."""
+        if self.output_format == "html":
+            return self.html_builder.iter_report(config, data)
+        else:
+            raise NotImplementedError(f"Output format {self.output_format} not supported yet.")
+
+    def __enter__(self) -> 'ReportGenerator':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the worker processes used for chart rendering."""
+        self.html_builder.close()
+
     def save_report(self, config: ReportConfiguration, data: Dict[str, Any], output_path: str) -> None:
-        report_content = self.generate_report(config, data)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(report_content)
\ No newline at end of file
+        # Write chunks as the template renders them rather than building the full string first
+        report_chunks = self.iter_report(config, data)
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.writelines(report_chunks)
\ No newline at end of file
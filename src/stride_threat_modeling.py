@@ -14,19 +14,29 @@ threat identification and analysis. This implementation demonstrates:
 
 Key Components:
 - StrideModel: Main threat modeling engine
+- StrideResults: Analysis results computed section by section on demand
 - ThreatComponent: Represents system components and their threats
 - DataFlow: Models data movement between components
 - ThreatAnalyzer: Analyzes threats using STRIDE methodology
 """
 
+import functools
 import json
 import logging
+import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Any
-from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Dict, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple
+from dataclasses import MISSING, dataclass, field, fields
 from enum import Enum
-import networkx as nx  # For modeling system architecture graphs
+from types import MappingProxyType
+import numpy as np
+
+try:
+    import orjson  # Optional: faster JSON parsing and serialization
+except ImportError:
+    orjson = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -62,7 +72,86 @@ class TrustBoundary(Enum):
     DEVICE_NETWORK = "DEVICE_NETWORK"        # IoT device network
     MANAGEMENT_NETWORK = "MANAGEMENT_NETWORK" # Network management zone
 
-@dataclass
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize obj to compact JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# Serialized string for every STRIDE category, component type and trust boundary,
+# resolved once instead of through Enum.value on each threat or component
+_ENUM_VALUES: Dict[Enum, str] = {
+    member: member.value
+    for enum_type in (StrideCategory, ComponentType, TrustBoundary)
+    for member in enum_type
+}
+
+# Component type for each "type" string in the system configuration
+_COMPONENT_TYPE_MAP: Mapping[str, ComponentType] = MappingProxyType({
+    "solar_inverter": ComponentType.SOLAR_INVERTER,
+    "gateway": ComponentType.COMMUNICATION_GATEWAY,
+    "api": ComponentType.API_ENDPOINT,
+    "database": ComponentType.DATABASE,
+    "web_interface": ComponentType.WEB_INTERFACE
+})
+
+# Likelihood reduction per STRIDE category for each security control keyword
+_CONTROL_REDUCTIONS = {
+    "encryption": {StrideCategory.INFORMATION_DISCLOSURE: 2, StrideCategory.TAMPERING: 1},
+    "authentication": {StrideCategory.SPOOFING: 2, StrideCategory.ELEVATION_OF_PRIVILEGE: 1},
+    "access_control": {StrideCategory.ELEVATION_OF_PRIVILEGE: 2, StrideCategory.SPOOFING: 1},
+    "rate_limiting": {StrideCategory.DENIAL_OF_SERVICE: 2},
+    "input_validation": {StrideCategory.TAMPERING: 1},
+    "logging": {StrideCategory.REPUDIATION: 2},
+    "monitoring": {StrideCategory.DENIAL_OF_SERVICE: 1, StrideCategory.SPOOFING: 1}
+}
+
+# Control keywords in column order of _REDUCTION_MATRIX
+_CONTROL_KEYWORDS: Tuple[str, ...] = tuple(_CONTROL_REDUCTIONS)
+
+# Same mapping as a (category, keyword) matrix; rows follow StrideCategory order
+_REDUCTION_MATRIX = np.array(
+    [[_CONTROL_REDUCTIONS[keyword].get(category, 0) for keyword in _CONTROL_KEYWORDS]
+     for category in StrideCategory],
+    dtype=np.int16
+)
+
+def _slotted_dataclass(cls):
+    """
+    Dataclass decorator that gives instances __slots__ instead of a __dict__.
+    
+    Used for the high-volume model records. dataclass(slots=True) needs
+    Python 3.10; on older interpreters the class is rebuilt with __slots__
+    the same way that option does it.
+    """
+    if sys.version_info >= (3, 10):
+        return dataclass(slots=True)(cls)
+    
+    cls = dataclass(cls)
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = field_names
+    for name in field_names + ("__dict__", "__weakref__"):
+        namespace.pop(name, None)
+    
+    # The generated __init__ carries every default except those of init=False
+    # fields, which it leaves to the class attribute removed above
+    class_defaults = tuple((f.name, f.default) for f in fields(cls)
+                           if not f.init and f.default is not MISSING)
+    if class_defaults:
+        init = namespace["__init__"]
+        
+        @functools.wraps(init)
+        def __init__(self, *args, **kwargs):
+            for name, value in class_defaults:
+                setattr(self, name, value)
+            init(self, *args, **kwargs)
+        
+        namespace["__init__"] = __init__
+    
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+@_slotted_dataclass
 class Threat:
     """
     Represents a single security threat identified through STRIDE analysis.
@@ -79,21 +168,17 @@ class Threat:
     impact_description: str
     likelihood: int  # 1-5 scale (1=very low, 5=very high)
     impact: int      # 1-5 scale (1=minimal, 5=catastrophic)
-    risk_score: int = field(init=False)  # Calculated automatically
-    mitigation_strategies: List[str] = field(default_factory=list)
+    risk_score: int  # template likelihood * impact, computed by the caller
+    mitigation_strategies: Sequence[str] = field(default_factory=list)
     references: List[str] = field(default_factory=list)
     
-    def __post_init__(self):
-        """Calculate risk score after object initialization."""
-        self.risk_score = self.likelihood * self.impact
-    
     def to_dict(self) -> Dict[str, Any]:
         """Convert threat to dictionary for JSON serialization."""
         return {
             "id": self.id,
             "title": self.title,
             "description": self.description,
-            "stride_category": self.stride_category.value,
+            "stride_category": _ENUM_VALUES[self.stride_category],
             "affected_component": self.affected_component,
             "attack_vector": self.attack_vector,
             "impact_description": self.impact_description,
@@ -110,7 +195,7 @@ class Threat:
         data['stride_category'] = StrideCategory(data['stride_category'])
         return cls(**data)
 
-@dataclass
+@_slotted_dataclass
 class DataFlow:
     """
     Represents data flow between system components.
@@ -141,10 +226,10 @@ class DataFlow:
             "crosses_trust_boundary": self.crosses_trust_boundary,
         }
         if self.trust_boundary_crossed:
-            data["trust_boundary_crossed"] = self.trust_boundary_crossed.value
+            data["trust_boundary_crossed"] = _ENUM_VALUES[self.trust_boundary_crossed]
         return data
 
-@dataclass
+@_slotted_dataclass
 class ThreatComponent:
     """
     Represents a component in the system architecture.
@@ -167,15 +252,112 @@ class ThreatComponent:
         return {
             "id": self.id,
             "name": self.name,
-            "component_type": self.component_type.value,
+            "component_type": _ENUM_VALUES[self.component_type],
             "description": self.description,
-            "trust_boundary": self.trust_boundary.value,
+            "trust_boundary": _ENUM_VALUES[self.trust_boundary],
             "processes_data": self.processes_data,
             "stores_data": self.stores_data,
             "external_dependencies": self.external_dependencies,
             "security_controls": self.security_controls
         }
 
+# Position of each STRIDE category in ThreatTable.category
+_CATEGORY_INDEX = {category: index for index, category in enumerate(StrideCategory)}
+
+# Serialized STRIDE category names in the same order, every category always present
+_STRIDE_LABELS = tuple(_ENUM_VALUES[category] for category in StrideCategory)
+
+# Risk level labels and the lowest score of each level above LOW (for np.digitize)
+_RISK_LEVELS = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+_RISK_BUCKET_EDGES = (6, 11, 16)
+
+@dataclass
+class ThreatTable:
+    """
+    Column-oriented (structure-of-arrays) view of a list of threats.
+    
+    Row i describes threats[i]. Aggregations read these contiguous NumPy
+    columns instead of walking Threat objects attribute by attribute.
+    """
+    likelihood: np.ndarray  # int8
+    impact: np.ndarray      # int8
+    risk: np.ndarray        # int8
+    category: np.ndarray    # int8, index into StrideCategory
+    component: np.ndarray   # int32, index into the component id list (-1 if unknown)
+    mitigation_count: np.ndarray  # int32, number of mitigation strategies per threat
+    mitigation: np.ndarray  # intp, mitigation id of every strategy, row after row
+    mitigation_names: List[str]  # mitigation text per id, in order of first appearance
+    threat_id: np.ndarray   # object, Threat.id per row
+    
+    @classmethod
+    def from_threats(cls, threats: List[Threat], component_ids: List[str]) -> 'ThreatTable':
+        """Build the columns for a threat list against an ordered list of component ids."""
+        component_index = {component_id: index for index, component_id in enumerate(component_ids)}
+        mitigation_ids: Dict[str, int] = {}
+        # Threats from the same template share one strategies sequence, so each
+        # distinct sequence is resolved to mitigation ids once and reused by identity
+        sequence_ids: Dict[int, List[int]] = {}
+        mitigation: List[int] = []
+        threat_ids: List[str] = []
+        
+        # One pass over the Threat objects gathers every column at once
+        rows = []
+        for t in threats:
+            threat_ids.append(t.id)
+            strategies = t.mitigation_strategies
+            ids = sequence_ids.get(id(strategies))
+            if ids is None:
+                ids = sequence_ids[id(strategies)] = [
+                    mitigation_ids.setdefault(name, len(mitigation_ids)) for name in strategies
+                ]
+            mitigation.extend(ids)
+            rows.append((t.likelihood, t.impact, t.risk_score, _CATEGORY_INDEX[t.stride_category],
+                         component_index.get(t.affected_component, -1), len(ids)))
+        
+        columns = np.array(rows, dtype=np.int32).reshape(len(threats), 6)
+        return cls(
+            likelihood=columns[:, 0].astype(np.int8),
+            impact=columns[:, 1].astype(np.int8),
+            risk=columns[:, 2].astype(np.int8),
+            category=columns[:, 3].astype(np.int8),
+            component=columns[:, 4].copy(),
+            mitigation_count=columns[:, 5].copy(),
+            mitigation=np.array(mitigation, dtype=np.intp),
+            mitigation_names=list(mitigation_ids),
+            threat_id=np.array(threat_ids, dtype=object)
+        )
+    
+    def threats_per_component(self, component_count: int) -> np.ndarray:
+        """Number of threats against each component index (threats on unknown components excluded)."""
+        return np.bincount(self.component[self.component >= 0], minlength=component_count)
+
+def _top_rows(values: np.ndarray, count: int) -> List[int]:
+    """
+    Row indices of the count largest values, largest first.
+    
+    Ties keep their original row order, matching a stable descending sort.
+    np.partition finds the cut-off value in linear time, so only the rows
+    at or above it are sorted.
+    """
+    count = min(count, len(values))
+    if count == 0:
+        return []
+    cutoff = np.partition(values, len(values) - count)[len(values) - count]
+    candidates = np.flatnonzero(values >= cutoff)
+    order = np.argsort(-values[candidates].astype(np.int64), kind='stable')
+    return candidates[order[:count]].tolist()
+
+class ThreatTemplate(NamedTuple):
+    """Component-type threat pattern instantiated into a Threat per component."""
+    stride_category: StrideCategory
+    title: str
+    description: str
+    attack_vector: str
+    impact_description: str
+    likelihood: int
+    impact: int
+    mitigation_strategies: Tuple[str, ...]
+
 class ThreatAnalyzer:
     """
     Analyzes system components for STRIDE threats.
@@ -185,9 +367,19 @@ class ThreatAnalyzer:
     """
     
     def __init__(self):
-        self.threat_templates = self._load_threat_templates()
+        self.threat_templates = self._shared_threat_templates()
+        # Components sharing a type and control set get identical scores,
+        # so the adjustment is computed once per (type, controls) profile
+        self._profile_scores = functools.lru_cache(maxsize=256)(self._analyze_profile)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _shared_threat_templates(cls) -> Mapping[ComponentType, Tuple[ThreatTemplate, ...]]:
+        """Build the threat templates once and share them, read-only, across analyzers."""
+        return MappingProxyType(cls._load_threat_templates())
     
-    def _load_threat_templates(self) -> Dict[str, List[Dict[str, Any]]]:
+    @staticmethod
+    def _load_threat_templates() -> Dict[ComponentType, Tuple[ThreatTemplate, ...]]:
         """
         Load threat templates for different component types.
         
@@ -196,138 +388,138 @@ class ThreatAnalyzer:
         can use template patterns for scalable threat analysis.
         """
         return {
-            ComponentType.SOLAR_INVERTER.value: [
-                {
-                    "stride_category": StrideCategory.SPOOFING,
-                    "title": "Inverter Identity Spoofing",
-                    "description": "Attacker impersonates legitimate inverter to inject malicious commands",
-                    "attack_vector": "Network protocol manipulation",
-                    "impact_description": "Unauthorized control of power generation",
-                    "likelihood": 3,
-                    "impact": 4,
-                    "mitigation_strategies": [
+            ComponentType.SOLAR_INVERTER: (
+                ThreatTemplate(
+                    stride_category=StrideCategory.SPOOFING,
+                    title="Inverter Identity Spoofing",
+                    description="Attacker impersonates legitimate inverter to inject malicious commands",
+                    attack_vector="Network protocol manipulation",
+                    impact_description="Unauthorized control of power generation",
+                    likelihood=3,
+                    impact=4,
+                    mitigation_strategies=(
                         "Implement device certificates",
                         "Use cryptographic device authentication",
                         "Monitor for unusual device behavior"
-                    ]
-                },
-                {
-                    "stride_category": StrideCategory.TAMPERING,
-                    "title": "Firmware Tampering",
-                    "description": "Malicious modification of inverter firmware",
-                    "attack_vector": "Insecure firmware update mechanism",
-                    "impact_description": "Complete device compromise",
-                    "likelihood": 2,
-                    "impact": 5,
-                    "mitigation_strategies": [
+                    )
+                ),
+                ThreatTemplate(
+                    stride_category=StrideCategory.TAMPERING,
+                    title="Firmware Tampering",
+                    description="Malicious modification of inverter firmware",
+                    attack_vector="Insecure firmware update mechanism",
+                    impact_description="Complete device compromise",
+                    likelihood=2,
+                    impact=5,
+                    mitigation_strategies=(
                         "Implement code signing for firmware",
                         "Secure boot process",
                         "Firmware integrity checks"
-                    ]
-                },
-                {
-                    "stride_category": StrideCategory.DENIAL_OF_SERVICE,
-                    "title": "Inverter Service Disruption",
-                    "description": "Flooding inverter with requests to cause service disruption",
-                    "attack_vector": "Network flooding attacks",
-                    "impact_description": "Loss of power generation capacity",
-                    "likelihood": 4,
-                    "impact": 3,
-                    "mitigation_strategies": [
+                    )
+                ),
+                ThreatTemplate(
+                    stride_category=StrideCategory.DENIAL_OF_SERVICE,
+                    title="Inverter Service Disruption",
+                    description="Flooding inverter with requests to cause service disruption",
+                    attack_vector="Network flooding attacks",
+                    impact_description="Loss of power generation capacity",
+                    likelihood=4,
+                    impact=3,
+                    mitigation_strategies=(
                         "Implement rate limiting",
                         "Network traffic filtering",
                         "DDoS protection mechanisms"
-                    ]
-                },
-                {
-                    "stride_category": StrideCategory.INFORMATION_DISCLOSURE,
-                    "title": "Power Generation Data Exposure",
-                    "description": "Unauthorized access to sensitive power generation data",
-                    "attack_vector": "Insecure data transmission",
-                    "impact_description": "Competitive intelligence theft",
-                    "likelihood": 3,
-                    "impact": 2,
-                    "mitigation_strategies": [
+                    )
+                ),
+                ThreatTemplate(
+                    stride_category=StrideCategory.INFORMATION_DISCLOSURE,
+                    title="Power Generation Data Exposure",
+                    description="Unauthorized access to sensitive power generation data",
+                    attack_vector="Insecure data transmission",
+                    impact_description="Competitive intelligence theft",
+                    likelihood=3,
+                    impact=2,
+                    mitigation_strategies=(
                         "Encrypt all data transmissions",
                         "Implement access controls",
                         "Data classification and handling procedures"
-                    ]
-                }
-            ],
-            ComponentType.API_ENDPOINT.value: [
-                {
-                    "stride_category": StrideCategory.SPOOFING,
-                    "title": "API Authentication Bypass",
-                    "description": "Attacker bypasses API authentication mechanisms",
-                    "attack_vector": "Weak authentication implementation",
-                    "impact_description": "Unauthorized API access",
-                    "likelihood": 3,
-                    "impact": 4,
-                    "mitigation_strategies": [
+                    )
+                )
+            ),
+            ComponentType.API_ENDPOINT: (
+                ThreatTemplate(
+                    stride_category=StrideCategory.SPOOFING,
+                    title="API Authentication Bypass",
+                    description="Attacker bypasses API authentication mechanisms",
+                    attack_vector="Weak authentication implementation",
+                    impact_description="Unauthorized API access",
+                    likelihood=3,
+                    impact=4,
+                    mitigation_strategies=(
                         "Implement strong authentication (OAuth 2.0, JWT)",
                         "Multi-factor authentication",
                         "Regular security audits"
-                    ]
-                },
-                {
-                    "stride_category": StrideCategory.TAMPERING,
-                    "title": "API Request Manipulation",
-                    "description": "Modification of API requests to perform unauthorized actions",
-                    "attack_vector": "Man-in-the-middle attacks",
-                    "impact_description": "Unauthorized system control",
-                    "likelihood": 2,
-                    "impact": 4,
-                    "mitigation_strategies": [
+                    )
+                ),
+                ThreatTemplate(
+                    stride_category=StrideCategory.TAMPERING,
+                    title="API Request Manipulation",
+                    description="Modification of API requests to perform unauthorized actions",
+                    attack_vector="Man-in-the-middle attacks",
+                    impact_description="Unauthorized system control",
+                    likelihood=2,
+                    impact=4,
+                    mitigation_strategies=(
                         "Use HTTPS for all API communications",
                         "Implement request signing",
                         "Input validation and sanitization"
-                    ]
-                },
-                {
-                    "stride_category": StrideCategory.ELEVATION_OF_PRIVILEGE,
-                    "title": "API Privilege Escalation",
-                    "description": "Attacker gains higher privileges than intended",
-                    "attack_vector": "Authorization bypass vulnerabilities",
-                    "impact_description": "Administrative access to system",
-                    "likelihood": 2,
-                    "impact": 5,
-                    "mitigation_strategies": [
+                    )
+                ),
+                ThreatTemplate(
+                    stride_category=StrideCategory.ELEVATION_OF_PRIVILEGE,
+                    title="API Privilege Escalation",
+                    description="Attacker gains higher privileges than intended",
+                    attack_vector="Authorization bypass vulnerabilities",
+                    impact_description="Administrative access to system",
+                    likelihood=2,
+                    impact=5,
+                    mitigation_strategies=(
                         "Implement proper authorization checks",
                         "Principle of least privilege",
                         "Regular access reviews"
-                    ]
-                }
-            ],
-            ComponentType.COMMUNICATION_GATEWAY.value: [
-                {
-                    "stride_category": StrideCategory.SPOOFING,
-                    "title": "Gateway Impersonation",
-                    "description": "Attacker impersonates communication gateway",
-                    "attack_vector": "Network protocol vulnerabilities",
-                    "impact_description": "Unauthorized network access",
-                    "likelihood": 3,
-                    "impact": 4,
-                    "mitigation_strategies": [
+                    )
+                )
+            ),
+            ComponentType.COMMUNICATION_GATEWAY: (
+                ThreatTemplate(
+                    stride_category=StrideCategory.SPOOFING,
+                    title="Gateway Impersonation",
+                    description="Attacker impersonates communication gateway",
+                    attack_vector="Network protocol vulnerabilities",
+                    impact_description="Unauthorized network access",
+                    likelihood=3,
+                    impact=4,
+                    mitigation_strategies=(
                         "Device certificates and PKI",
                         "Network access control",
                         "Regular device authentication"
-                    ]
-                },
-                {
-                    "stride_category": StrideCategory.DENIAL_OF_SERVICE,
-                    "title": "Gateway Resource Exhaustion",
-                    "description": "Overwhelming gateway with traffic to cause failure",
-                    "attack_vector": "Resource exhaustion attacks",
-                    "impact_description": "Communication network disruption",
-                    "likelihood": 3,
-                    "impact": 4,
-                    "mitigation_strategies": [
+                    )
+                ),
+                ThreatTemplate(
+                    stride_category=StrideCategory.DENIAL_OF_SERVICE,
+                    title="Gateway Resource Exhaustion",
+                    description="Overwhelming gateway with traffic to cause failure",
+                    attack_vector="Resource exhaustion attacks",
+                    impact_description="Communication network disruption",
+                    likelihood=3,
+                    impact=4,
+                    mitigation_strategies=(
                         "Implement quality of service controls",
                         "Resource monitoring and alerting",
                         "Traffic shaping and prioritization"
-                    ]
-                }
-            ]
+                    )
+                )
+            )
         }
     
     def analyze_component_threats(self, component: ThreatComponent) -> List[Threat]:
@@ -341,61 +533,174 @@ class ThreatAnalyzer:
             List of identified threats for the component
         """
         threats = []
-        component_templates = self.threat_templates.get(component.component_type.value, [])
+        component_templates = self.threat_templates.get(component.component_type, ())
+        # Built from the live control list so later edits to it are honoured
+        controls_key = tuple(sorted(control.lower() for control in component.security_controls))
+        scores = self._profile_scores(component.component_type, controls_key)
         
-        for template in component_templates:
-            threat_id = f"{component.id}_{template['stride_category'].value}_{len(threats)+1}"
+        for template, (likelihood, risk_score) in zip(component_templates, scores):
+            threat_id = f"{component.id}_{_ENUM_VALUES[template.stride_category]}_{len(threats)+1}"
             
             threat = Threat(
                 id=threat_id,
-                title=template["title"],
-                description=template["description"],
-                stride_category=template["stride_category"],
+                title=template.title,
+                description=template.description,
+                stride_category=template.stride_category,
                 affected_component=component.id,
-                attack_vector=template["attack_vector"],
-                impact_description=template["impact_description"],
-                likelihood=template["likelihood"],
-                impact=template["impact"],
-                mitigation_strategies=template["mitigation_strategies"].copy()
-            )
-            
-            # Adjust threat likelihood based on component security controls
-            threat.likelihood = self._adjust_likelihood_for_controls(
-                threat, component.security_controls
+                attack_vector=template.attack_vector,
+                impact_description=template.impact_description,
+                likelihood=likelihood,
+                impact=template.impact,
+                risk_score=risk_score,
+                mitigation_strategies=template.mitigation_strategies
             )
             
             threats.append(threat)
         
         return threats
     
-    def _adjust_likelihood_for_controls(self, threat: Threat, security_controls: List[str]) -> int:
+    def _analyze_profile(self, component_type: ComponentType,
+                         controls_key: Tuple[str, ...]) -> Tuple[Tuple[int, int], ...]:
         """
-        Adjust threat likelihood based on existing security controls.
+        Control-adjusted likelihood and risk score of each template for a component profile.
+        
+        The risk score is the template's likelihood times its impact; it is
+        not reduced by the component's security controls.
         
-        This demonstrates how security controls can reduce threat likelihood,
-        which is important for risk-based security management.
+        Args:
+            component_type: Component type selecting the templates
+            controls_key: The component's security controls, lower-cased and sorted
+            
+        Returns:
+            One (likelihood, risk_score) pair per template, in template order
         """
-        likelihood = threat.likelihood
-        
-        # Define control effectiveness mappings
-        control_reductions = {
-            "encryption": {StrideCategory.INFORMATION_DISCLOSURE: 2, StrideCategory.TAMPERING: 1},
-            "authentication": {StrideCategory.SPOOFING: 2, StrideCategory.ELEVATION_OF_PRIVILEGE: 1},
-            "access_control": {StrideCategory.ELEVATION_OF_PRIVILEGE: 2, StrideCategory.SPOOFING: 1},
-            "rate_limiting": {StrideCategory.DENIAL_OF_SERVICE: 2},
-            "input_validation": {StrideCategory.TAMPERING: 1},
-            "logging": {StrideCategory.REPUDIATION: 2},
-            "monitoring": {StrideCategory.DENIAL_OF_SERVICE: 1, StrideCategory.SPOOFING: 1}
+        templates = self.threat_templates.get(component_type, ())
+        if not templates:
+            return ()
+        
+        likelihoods = np.fromiter((template.likelihood for template in templates),
+                                  dtype=np.int16, count=len(templates))
+        impacts = np.fromiter((template.impact for template in templates),
+                              dtype=np.int16, count=len(templates))
+        categories = np.fromiter((_CATEGORY_INDEX[template.stride_category] for template in templates),
+                                 dtype=np.intp, count=len(templates))
+        
+        # Every control containing a keyword applies that keyword's reduction once.
+        # Repeated reductions floored at 1 equal one summed reduction floored at 1.
+        match_counts = np.array(
+            [sum(keyword in control for control in controls_key) for keyword in _CONTROL_KEYWORDS],
+            dtype=np.int16
+        )
+        adjusted = np.maximum(1, likelihoods - _REDUCTION_MATRIX[categories] @ match_counts)
+        risk_scores = likelihoods * impacts
+        return tuple(zip(adjusted.tolist(), risk_scores.tolist()))
+
+class StrideResults:
+    """
+    STRIDE analysis results with each section computed on first access.
+    
+    Callers that only need part of the analysis (for example the system
+    summary) skip the per-threat aggregation of the other sections;
+    to_dict() evaluates all of them. The analysis is captured when the
+    results are created, so sections stay consistent with each other even
+    if the model is changed or analyzed again before they are read.
+    """
+    
+    def __init__(self, model: 'StrideModel', top_n: int = 10):
+        self._model = model
+        self._top_n = top_n
+        self._components: Tuple[ThreatComponent, ...] = tuple(model.components)
+        self._data_flow_count = len(model.data_flows)
+        self._threats: Tuple[Threat, ...] = tuple(model.threats)
+        self._threat_table: ThreatTable = model.threat_table
+        self.analysis_timestamp = datetime.now().isoformat()
+    
+    @functools.cached_property
+    def system_summary(self) -> Dict[str, int]:
+        """Component, data flow and threat totals."""
+        return {
+            "total_components": len(self._components),
+            "total_data_flows": self._data_flow_count,
+            "total_threats": len(self._threats)
         }
+    
+    @functools.cached_property
+    def stride_breakdown(self) -> Dict[str, int]:
+        """Threat count per STRIDE category."""
+        category_counts = np.bincount(self._threat_table.category, minlength=len(_STRIDE_LABELS))
+        return dict(zip(_STRIDE_LABELS, category_counts.tolist()))
+    
+    @functools.cached_property
+    def risk_distribution(self) -> Dict[str, int]:
+        """Threat count per risk level: scores 1-5 LOW, 6-10 MEDIUM, 11-15 HIGH, 16+ CRITICAL."""
+        bucket_counts = np.bincount(np.digitize(self._threat_table.risk, _RISK_BUCKET_EDGES),
+                                    minlength=len(_RISK_LEVELS))
+        return dict(zip(_RISK_LEVELS, bucket_counts.tolist()))
+    
+    @functools.cached_property
+    def component_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Component vulnerability summary, aggregated over the threat columns."""
+        table = self._threat_table
+        components = self._components
+        known = table.component >= 0
+        threat_counts = table.threats_per_component(len(components))
+        risk_totals = np.bincount(table.component[known], weights=table.risk[known],
+                                  minlength=len(components))
         
-        for control in security_controls:
-            control_lower = control.lower()
-            for control_name, reductions in control_reductions.items():
-                if control_name in control_lower:
-                    reduction = reductions.get(threat.stride_category, 0)
-                    likelihood = max(1, likelihood - reduction)
+        # Highest-risk threat per component (earliest one on ties): order rows by
+        # component, then descending risk, and take the first row of each group
+        order = np.lexsort((-table.risk, table.component))
+        group_ids, group_starts = np.unique(table.component[order], return_index=True)
+        highest_risk_rows = dict(zip(group_ids.tolist(), order[group_starts].tolist()))
         
-        return likelihood
+        component_summary = {}
+        for index, component in enumerate(components):
+            threat_count = int(threat_counts[index])
+            avg_risk = float(risk_totals[index]) / threat_count if threat_count else 0
+            highest_risk_row = highest_risk_rows.get(index)
+            
+            component_summary[component.id] = {
+                "name": component.name,
+                "type": _ENUM_VALUES[component.component_type],
+                "threat_count": threat_count,
+                "average_risk_score": round(avg_risk, 2),
+                "highest_risk_threat": self._threats[highest_risk_row].title if highest_risk_row is not None else None
+            }
+        return component_summary
+    
+    @functools.cached_property
+    def top_threats(self) -> List[Dict[str, Any]]:
+        """The top_n highest-risk threats."""
+        return [self._threats[row].to_dict() for row in _top_rows(self._threat_table.risk, self._top_n)]
+    
+    @functools.cached_property
+    def all_threats(self) -> List[Dict[str, Any]]:
+        """Every identified threat."""
+        return [threat.to_dict() for threat in self._threats]
+    
+    @functools.cached_property
+    def mitigation_recommendations(self) -> List[Dict[str, Any]]:
+        """Prioritized mitigation recommendations."""
+        return self._model._generate_mitigation_recommendations(self._threat_table)
+    
+    def to_dict(self, include_all_threats: bool = True) -> Dict[str, Any]:
+        """
+        Evaluate every section into the run_stride_analysis result dictionary.
+        
+        Args:
+            include_all_threats: Serialize every threat into "all_threats";
+                when False the key is kept (for ordering) with a None value
+        """
+        return {
+            "analysis_timestamp": self.analysis_timestamp,
+            "system_summary": self.system_summary,
+            "stride_breakdown": self.stride_breakdown,
+            "risk_distribution": self.risk_distribution,
+            "component_summary": self.component_summary,
+            "top_threats": self.top_threats,
+            "all_threats": self.all_threats if include_all_threats else None,
+            "mitigation_recommendations": self.mitigation_recommendations
+        }
 
 class StrideModel:
     """
@@ -411,8 +716,20 @@ class StrideModel:
         self.components: List[ThreatComponent] = []
         self.data_flows: List[DataFlow] = []
         self.threats: List[Threat] = []
+        self.threat_table: Optional[ThreatTable] = None
         self.threat_analyzer = ThreatAnalyzer()
-        self.system_graph = nx.DiGraph()  # NetworkX graph for system modeling
+        
+        # NetworkX graph behind system_graph, built from components and
+        # data_flows on first access
+        self._system_graph = None
+        
+        # run_stride_analysis results, reused while the analysis inputs
+        # (see _analysis_fingerprint) and top_n are unchanged
+        self._analysis_cache: Optional[Dict[str, Any]] = None
+        self._analysis_cache_key: Optional[Tuple[Any, ...]] = None
+        
+        # Export directories already created by this model
+        self._ensured_dirs: Set[Path] = set()
         
         # Load system configuration
         self._load_system_configuration()
@@ -421,8 +738,9 @@ class StrideModel:
         """Load system configuration and build threat model."""
         try:
             if self.config_path.exists():
-                with open(self.config_path, 'r') as f:
-                    config = json.load(f)
+                with open(self.config_path, 'rb') as f:
+                    raw_config = f.read()
+                config = orjson.loads(raw_config) if orjson is not None else json.loads(raw_config)
                 self._build_components_from_config(config)
                 self._build_data_flows_from_config(config)
             else:
@@ -435,47 +753,40 @@ class StrideModel:
     def _build_components_from_config(self, config: Dict[str, Any]) -> None:
         """Build threat model components from configuration."""
         self.components = []
+        self._system_graph = None
         
         for comp_config in config.get("components", []):
-            # Map component types
-            comp_type_map = {
-                "solar_inverter": ComponentType.SOLAR_INVERTER,
-                "gateway": ComponentType.COMMUNICATION_GATEWAY,
-                "api": ComponentType.API_ENDPOINT,
-                "database": ComponentType.DATABASE,
-                "web_interface": ComponentType.WEB_INTERFACE
-            }
+            get = comp_config.get
+            component_id = comp_config["id"]
+            type_name = get("type", "")
             
-            component_type = comp_type_map.get(
-                comp_config.get("type", ""), 
-                ComponentType.SOLAR_INVERTER
-            )
+            # Map component types
+            component_type = _COMPONENT_TYPE_MAP.get(type_name, ComponentType.SOLAR_INVERTER)
             
             # Determine trust boundary based on component type and network exposure
-            trust_boundary = self._determine_trust_boundary(comp_config)
+            trust_boundary = self._determine_trust_boundary(type_name, get("internet_facing", False))
             
             component = ThreatComponent(
-                id=comp_config["id"],
-                name=comp_config.get("name", comp_config["id"]),
+                id=component_id,
+                name=get("name", component_id),
                 component_type=component_type,
-                description=comp_config.get("description", ""),
+                description=get("description", ""),
                 trust_boundary=trust_boundary,
-                processes_data=comp_config.get("processes_data", []),
-                stores_data=comp_config.get("stores_data", []),
-                external_dependencies=comp_config.get("external_dependencies", []),
-                security_controls=comp_config.get("security_controls", [])
+                processes_data=get("processes_data", []),
+                stores_data=get("stores_data", []),
+                external_dependencies=get("external_dependencies", []),
+                security_controls=get("security_controls", [])
             )
             
-            self.components.append(component)
-            self.system_graph.add_node(component.id, component=component)
+            self.add_component(component)
     
-    def _determine_trust_boundary(self, comp_config: Dict[str, Any]) -> TrustBoundary:
-        """Determine appropriate trust boundary for component."""
-        if comp_config.get("internet_facing", False):
+    def _determine_trust_boundary(self, type_name: str, internet_facing: bool) -> TrustBoundary:
+        """Determine appropriate trust boundary for a component's config type and exposure."""
+        if internet_facing:
             return TrustBoundary.INTERNET
-        elif comp_config.get("type") == "api":
+        elif type_name == "api":
             return TrustBoundary.DMZ
-        elif comp_config.get("type") in ["solar_inverter", "gateway"]:
+        elif type_name in ("solar_inverter", "gateway"):
             return TrustBoundary.DEVICE_NETWORK
         else:
             return TrustBoundary.INTERNAL_NETWORK
@@ -483,6 +794,7 @@ class StrideModel:
     def _build_data_flows_from_config(self, config: Dict[str, Any]) -> None:
         """Build data flows from configuration."""
         self.data_flows = []
+        self._system_graph = None
         
         # Generate data flows based on component relationships
         for comp_config in config.get("components", []):
@@ -501,8 +813,7 @@ class StrideModel:
                     crosses_trust_boundary=True,
                     trust_boundary_crossed=TrustBoundary.INTERNET
                 )
-                self.data_flows.append(data_flow)
-                self.system_graph.add_edge("external_client", comp_id, data_flow=data_flow)
+                self.add_data_flow(data_flow)
             
             # Protocol communications
             for protocol in comp_config.get("protocols", []):
@@ -517,8 +828,7 @@ class StrideModel:
                         authentication_required=False,
                         crosses_trust_boundary=False
                     )
-                    self.data_flows.append(data_flow)
-                    self.system_graph.add_edge(comp_id, "monitoring_system", data_flow=data_flow)
+                    self.add_data_flow(data_flow)
     
     def _create_default_model(self) -> None:
         """Create a default threat model for demonstration."""
@@ -556,46 +866,180 @@ class StrideModel:
             security_controls=["https", "api_authentication", "rate_limiting"]
         )
         
-        self.components = [inverter, gateway, api]
+        self.components = []
+        self._system_graph = None
+        for component in (inverter, gateway, api):
+            self.add_component(component)
+    
+    def add_component(self, component: ThreatComponent) -> None:
+        """Add a component to the system model."""
+        self.components.append(component)
+        if self._system_graph is not None:
+            self._system_graph.add_node(component.id, component=component)
+    
+    def add_data_flow(self, data_flow: DataFlow) -> None:
+        """Add a data flow between two components to the system model."""
+        self.data_flows.append(data_flow)
+        if self._system_graph is not None:
+            self._system_graph.add_edge(data_flow.source_component, data_flow.destination_component,
+                                        data_flow=data_flow)
+    
+    def to_networkx(self):
+        """
+        Build a new NetworkX DiGraph from the components and data flows.
         
-        # Build system graph
+        Nodes carry their ThreatComponent under "component" and edges their
+        DataFlow under "data_flow". NetworkX is only imported when called.
+        """
+        import networkx as nx
+        
+        graph = nx.DiGraph()
         for component in self.components:
-            self.system_graph.add_node(component.id, component=component)
+            graph.add_node(component.id, component=component)
+        for data_flow in self.data_flows:
+            graph.add_edge(data_flow.source_component, data_flow.destination_component, data_flow=data_flow)
+        return graph
+    
+    @property
+    def system_graph(self):
+        """
+        NetworkX graph of the system architecture.
+        
+        The components and data_flows lists are the model; this graph is a
+        view of them, built by to_networkx() on first access and then kept.
+        add_component and add_data_flow extend it, and annotations made on
+        the graph directly are preserved, but such edits are not reflected
+        back into the model or into to_networkx().
+        """
+        if self._system_graph is None:
+            self._system_graph = self.to_networkx()
+        return self._system_graph
     
-    def run_stride_analysis(self) -> Dict[str, Any]:
+    def run_stride_analysis(self, top_n: int = 10) -> Dict[str, Any]:
         """
         Run complete STRIDE analysis on the system.
         
+        Results are cached and the same dictionary is returned again while
+        the components, data flows and top_n are unchanged, including edits
+        made to them in place; copy it before modifying it.
+        
+        Args:
+            top_n: Number of highest-risk threats to include in "top_threats"
+        
         Returns:
             Comprehensive threat analysis results
         """
+        cache_key = (self._analysis_fingerprint(), top_n)
+        if self._analysis_cache is not None and self._analysis_cache_key == cache_key:
+            return self._analysis_cache
+        
+        logger.info("Starting STRIDE threat analysis")
+        
+        self._identify_threats()
+        
+        # Generate analysis results
+        results = self._generate_analysis_results(top_n=top_n)
+        
+        logger.info(f"STRIDE analysis completed. Found {len(self.threats)} threats")
+        self._analysis_cache = results
+        self._analysis_cache_key = cache_key
+        return results
+    
+    def _analysis_fingerprint(self) -> Tuple[Any, ...]:
+        """Every component and data flow value the analysis reads, as a comparable key."""
+        return (
+            tuple((component.id, component.name, component.component_type, tuple(component.security_controls))
+                  for component in self.components),
+            tuple((flow.id, flow.destination_component, flow.crosses_trust_boundary,
+                   flow.encryption_in_transit, flow.authentication_required)
+                  for flow in self.data_flows)
+        )
+    
+    def analyze(self, top_n: int = 10) -> 'StrideResults':
+        """
+        Identify threats and return results that are computed on demand.
+        
+        Args:
+            top_n: Number of highest-risk threats to include in top_threats
+        
+        Returns:
+            StrideResults whose sections are evaluated when first read
+        """
+        logger.info("Starting STRIDE threat analysis")
+        
+        self._identify_threats()
+        
+        logger.info(f"STRIDE analysis completed. Found {len(self.threats)} threats")
+        return StrideResults(self, top_n=top_n)
+    
+    def run_stride_analysis_to_stream(self, fp: BinaryIO) -> None:
+        """
+        Run STRIDE analysis and write the results as JSON to a binary stream.
+        
+        Produces the same document as run_stride_analysis, but the
+        all_threats list is serialized one threat at a time rather than
+        being built in memory first.
+        
+        Args:
+            fp: Writable binary file object
+        """
         logger.info("Starting STRIDE threat analysis")
         
-        # Clear previous threats
-        self.threats = []
+        self._identify_threats()
+        results = self._generate_analysis_results(include_all_threats=False)
+        
+        fp.write(b"{")
+        for position, (key, value) in enumerate(results.items()):
+            if position:
+                fp.write(b",")
+            fp.write(_json_bytes(key) + b":")
+            
+            if key != "all_threats":
+                fp.write(_json_bytes(value))
+                continue
+            
+            fp.write(b"[")
+            for index, threat in enumerate(self.threats):
+                if index:
+                    fp.write(b",")
+                fp.write(_json_bytes(threat.to_dict()))
+            fp.write(b"]")
+        fp.write(b"}")
+        
+        logger.info(f"STRIDE analysis completed. Found {len(self.threats)} threats")
+    
+    def _identify_threats(self) -> None:
+        """Populate self.threats from component templates and data flows."""
+        threats: List[Threat] = []
         
         # Analyze each component
         for component in self.components:
             logger.info(f"Analyzing component: {component.name}")
-            component_threats = self.threat_analyzer.analyze_component_threats(component)
-            self.threats.extend(component_threats)
+            threats.extend(self.threat_analyzer.analyze_component_threats(component))
         
         # Analyze data flows for additional threats
-        data_flow_threats = self._analyze_data_flow_threats()
-        self.threats.extend(data_flow_threats)
-        
-        # Generate analysis results
-        results = self._generate_analysis_results()
-        
-        logger.info(f"STRIDE analysis completed. Found {len(self.threats)} threats")
-        return results
+        threats.extend(self._analyze_data_flow_threats())
+        self.threats = threats
+        self.threat_table = ThreatTable.from_threats(
+            threats, [component.id for component in self.components]
+        )
     
     def _analyze_data_flow_threats(self) -> List[Threat]:
         """Analyze data flows for crossing trust boundaries and other risks."""
         threats = []
+        count = len(self.data_flows)
+        crosses = np.fromiter((flow.crosses_trust_boundary for flow in self.data_flows), dtype=bool, count=count)
+        encrypted = np.fromiter((flow.encryption_in_transit for flow in self.data_flows), dtype=bool, count=count)
+        authenticated = np.fromiter((flow.authentication_required for flow in self.data_flows), dtype=bool, count=count)
         
-        for data_flow in self.data_flows:
-            if data_flow.crosses_trust_boundary and not data_flow.encryption_in_transit:
+        unencrypted_crossing = crosses & ~encrypted
+        unauthenticated_crossing = crosses & ~authenticated
+        
+        # Only flows that raise at least one threat are visited, in flow order
+        for index in np.flatnonzero(unencrypted_crossing | unauthenticated_crossing).tolist():
+            data_flow = self.data_flows[index]
+            
+            if unencrypted_crossing[index]:
                 threat = Threat(
                     id=f"dataflow_{data_flow.id}_encryption",
                     title="Unencrypted Trust Boundary Crossing",
@@ -606,15 +1050,16 @@ class StrideModel:
                     impact_description="Sensitive data exposure",
                     likelihood=4,
                     impact=3,
-                    mitigation_strategies=[
+                    risk_score=4 * 3,
+                    mitigation_strategies=(
                         "Implement TLS/SSL encryption",
                         "Use VPN for sensitive communications",
                         "Implement end-to-end encryption"
-                    ]
+                    )
                 )
                 threats.append(threat)
             
-            if not data_flow.authentication_required and data_flow.crosses_trust_boundary:
+            if unauthenticated_crossing[index]:
                 threat = Threat(
                     id=f"dataflow_{data_flow.id}_auth",
                     title="Unauthenticated Trust Boundary Access",
@@ -625,119 +1070,109 @@ class StrideModel:
                     impact_description="Unauthorized system access",
                     likelihood=3,
                     impact=4,
-                    mitigation_strategies=[
+                    risk_score=3 * 4,
+                    mitigation_strategies=(
                         "Implement strong authentication",
                         "Use mutual TLS authentication",
                         "Deploy certificate-based authentication"
-                    ]
+                    )
                 )
                 threats.append(threat)
         
         return threats
     
-    def _generate_analysis_results(self) -> Dict[str, Any]:
-        """Generate comprehensive analysis results."""
-        # Categorize threats by STRIDE category
-        stride_breakdown = {}
-        for category in StrideCategory:
-            stride_breakdown[category.value] = [
-                threat for threat in self.threats 
-                if threat.stride_category == category
-            ]
-        
-        # Risk distribution
-        risk_distribution = {"LOW": 0, "MEDIUM": 0, "HIGH": 0, "CRITICAL": 0}
-        for threat in self.threats:
-            if threat.risk_score <= 5:
-                risk_distribution["LOW"] += 1
-            elif threat.risk_score <= 10:
-                risk_distribution["MEDIUM"] += 1
-            elif threat.risk_score <= 15:
-                risk_distribution["HIGH"] += 1
-            else:
-                risk_distribution["CRITICAL"] += 1
+    def _generate_analysis_results(self, include_all_threats: bool = True, top_n: int = 10) -> Dict[str, Any]:
+        """
+        Generate comprehensive analysis results.
         
-        # Component vulnerability summary
-        component_summary = {}
-        for component in self.components:
-            component_threats = [t for t in self.threats if t.affected_component == component.id]
-            avg_risk = sum(t.risk_score for t in component_threats) / len(component_threats) if component_threats else 0
-            
-            component_summary[component.id] = {
-                "name": component.name,
-                "type": component.component_type.value,
-                "threat_count": len(component_threats),
-                "average_risk_score": round(avg_risk, 2),
-                "highest_risk_threat": max(component_threats, key=lambda t: t.risk_score).title if component_threats else None
-            }
+        Args:
+            include_all_threats: Serialize every threat into "all_threats";
+                when False the key is kept (for ordering) with a None value
+            top_n: Number of highest-risk threats to include in "top_threats"
+        """
+        return StrideResults(self, top_n=top_n).to_dict(include_all_threats=include_all_threats)
+    
+    def _generate_mitigation_recommendations(self, table: Optional[ThreatTable] = None) -> List[Dict[str, Any]]:
+        """
+        Generate prioritized mitigation recommendations.
         
-        # Top threats by risk score
-        top_threats = sorted(self.threats, key=lambda t: t.risk_score, reverse=True)[:10]
+        Args:
+            table: Threat table to aggregate; defaults to the latest analysis
+        """
+        if table is None:
+            table = self.threat_table
         
-        return {
-            "analysis_timestamp": datetime.now().isoformat(),
-            "system_summary": {
-                "total_components": len(self.components),
-                "total_data_flows": len(self.data_flows),
-                "total_threats": len(self.threats)
-            },
-            "stride_breakdown": {
-                category: len(threats) for category, threats in stride_breakdown.items()
-            },
-            "risk_distribution": risk_distribution,
-            "component_summary": component_summary,
-            "top_threats": [threat.to_dict() for threat in top_threats],
-            "all_threats": [threat.to_dict() for threat in self.threats],
-            "mitigation_recommendations": self._generate_mitigation_recommendations()
-        }
-    
-    def _generate_mitigation_recommendations(self) -> List[Dict[str, Any]]:
-        """Generate prioritized mitigation recommendations."""
-        # Collect all mitigation strategies and their frequency
-        mitigation_counts = {}
-        for threat in self.threats:
-            for mitigation in threat.mitigation_strategies:
-                if mitigation not in mitigation_counts:
-                    mitigation_counts[mitigation] = {
-                        "count": 0,
-                        "total_risk": 0,
-                        "threat_ids": []
-                    }
-                mitigation_counts[mitigation]["count"] += 1
-                mitigation_counts[mitigation]["total_risk"] += threat.risk_score
-                mitigation_counts[mitigation]["threat_ids"].append(threat.id)
-        
-        # Sort by impact (count * average risk)
+        # The threat table holds one mitigation id per (threat, strategy) pair;
+        # sum the frequency and risk of each mitigation over those pairs
+        mitigation_index = table.mitigation
+        rows = np.repeat(np.arange(len(table.risk)), table.mitigation_count)
+        counts = np.bincount(mitigation_index, minlength=len(table.mitigation_names))
+        total_risks = np.bincount(mitigation_index, weights=table.risk[rows],
+                                  minlength=len(table.mitigation_names))
+        
+        # Affected threat ids for every pair, grouped by mitigation with each group
+        # in threat order; group i is affected_ids[offsets[i]:offsets[i + 1]]
+        affected_ids = table.threat_id[rows[np.argsort(mitigation_index, kind='stable')]].tolist()
+        offsets = [0] + np.cumsum(counts).tolist()
+        
+        # Impact is count * average risk, i.e. the (integer) total risk; only the
+        # top 15 mitigations by impact (highest first) are turned into dicts
+        impact_scores = total_risks.astype(np.int64)
         recommendations = []
-        for mitigation, data in mitigation_counts.items():
-            avg_risk = data["total_risk"] / data["count"]
-            impact_score = data["count"] * avg_risk
+        for index in _top_rows(impact_scores, 15):
+            count = int(counts[index])
+            avg_risk = float(total_risks[index]) / count
             
             recommendations.append({
-                "mitigation": mitigation,
-                "threat_count": data["count"],
+                "mitigation": table.mitigation_names[index],
+                "threat_count": count,
                 "average_risk_reduction": round(avg_risk, 2),
-                "impact_score": round(impact_score, 2),
-                "affected_threats": data["threat_ids"]
+                "impact_score": round(float(impact_scores[index]), 2),
+                "affected_threats": affected_ids[offsets[index]:offsets[index + 1]]
             })
         
-        # Sort by impact score (highest first)
-        recommendations.sort(key=lambda x: x["impact_score"], reverse=True)
-        
-        return recommendations[:15]  # Return top 15 recommendations
+        return recommendations
     
-    def export_threat_model(self, output_path: str = "outputs/threat_model_results.json") -> None:
-        """Export threat model results to JSON file."""
-        results = self.run_stride_analysis()
+    def export_threat_model(self, output_path: str = "outputs/threat_model_results.json",
+                            results: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Export threat model results to JSON file.
+        
+        Args:
+            output_path: Destination JSON file
+            results: Results of an earlier run_stride_analysis call to export;
+                the analysis is run when omitted
+        """
+        if results is None:
+            results = self.run_stride_analysis()
         
         output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_dir = output_file.parent
+        if output_dir not in self._ensured_dirs:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(output_dir)
         
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        try:
+            self._write_results_json(output_file, results)
+        except FileNotFoundError:
+            # The directory was removed after it was first created; recreate it and retry
+            self._ensured_dirs.discard(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(output_dir)
+            self._write_results_json(output_file, results)
         
         logger.info(f"Threat model exported to {output_path}")
     
+    @staticmethod
+    def _write_results_json(output_file: Path, results: Dict[str, Any]) -> None:
+        """Write analysis results as indented JSON."""
+        if orjson is not None:
+            output_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            # json.dump emits many small fragments; a large buffer batches them into few writes
+            with open(output_file, 'w', buffering=1 << 20) as f:
+                json.dump(results, f, indent=2)
+    
     def generate_data_flow_diagram(self) -> Dict[str, Any]:
         """
         Generate data flow diagram representation.
@@ -749,14 +1184,18 @@ class StrideModel:
         nodes = []
         edges = []
         
+        # Count the current threats by component id in one pass; the threat
+        # table may predate later changes to self.threats
+        threat_counts = Counter(threat.affected_component for threat in self.threats)
+        
         # Add components as nodes
         for component in self.components:
             nodes.append({
                 "id": component.id,
                 "label": component.name,
-                "type": component.component_type.value,
-                "trust_boundary": component.trust_boundary.value,
-                "threat_count": len([t for t in self.threats if t.affected_component == component.id])
+                "type": _ENUM_VALUES[component.component_type],
+                "trust_boundary": _ENUM_VALUES[component.trust_boundary],
+                "threat_count": threat_counts[component.id]
             })
         
         # Add data flows as edges
@@ -786,7 +1225,7 @@ def main():
     results = stride_model.run_stride_analysis()
     
     # Export results
-    stride_model.export_threat_model()
+    stride_model.export_threat_model(results=results)
     
     # Print summary
     print(f"STRIDE Analysis Results:")
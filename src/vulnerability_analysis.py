@@ -20,7 +20,7 @@ import requests
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from enum import Enum
 import random
 
@@ -76,14 +76,27 @@ class Vulnerability:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert vulnerability to dictionary for JSON serialization."""
-        data = asdict(self)
-        # Convert datetime objects to ISO format strings
-        data['discovery_date'] = self.discovery_date.isoformat()
-        data['publication_date'] = self.publication_date.isoformat()
-        # Convert enums to string values
-        data['severity'] = self.severity.value
-        data['vulnerability_type'] = self.vulnerability_type.value
-        return data
+        # Built field by field rather than via asdict(), which recursively
+        # deep-copies every field only for dates and enums to be replaced
+        return {
+            'cve_id': self.cve_id,
+            'title': self.title,
+            'description': self.description,
+            'severity': self.severity.value,
+            'cvss_score': self.cvss_score,
+            'vulnerability_type': self.vulnerability_type.value,
+            'affected_components': self.affected_components,
+            'affected_protocols': self.affected_protocols,
+            'manufacturer': self.manufacturer,
+            'model': self.model,
+            'firmware_versions': self.firmware_versions,
+            'discovery_date': self.discovery_date.isoformat(),
+            'publication_date': self.publication_date.isoformat(),
+            'mitigation_available': self.mitigation_available,
+            'mitigation_description': self.mitigation_description,
+            'exploit_available': self.exploit_available,
+            'references': self.references
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Vulnerability':
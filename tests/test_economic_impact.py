@@ -1,9 +1,13 @@
 import pytest
 from src.economic_impact import EconomicImpactCalculator
 
-def test_run_comprehensive_economic_analysis():
+@pytest.fixture(scope="module")
+def economic_results():
     calculator = EconomicImpactCalculator()
-    results = calculator.run_comprehensive_economic_analysis()
+    return calculator.run_comprehensive_economic_analysis()
+
+def test_run_comprehensive_economic_analysis(economic_results):
+    results = economic_results
     assert isinstance(results, dict)
     assert "scenario_analysis" in results
     assert "aggregated_metrics" in results
@@ -0,0 +1,70 @@
+import re
+
+import pytest
+from src.report_generator import REPORT_CHARTS, ReportConfiguration, ReportGenerator
+
+@pytest.fixture(scope="module")
+def report_generator():
+    return ReportGenerator()
+
+@pytest.fixture
+def report_config():
+    return ReportConfiguration(
+        report_title="Test Security Report",
+        organization="Test Organization",
+        author="Test Author",
+        include_visualizations=False
+    )
+
+@pytest.fixture
+def report_data():
+    return {
+        "executive_summary": "Summary of findings",
+        "technical_details": "Technical details",
+        "recommendations": ["Enable multi-factor authentication", "Rotate API keys"]
+    }
+
+def test_save_report_matches_generate_report(report_generator, report_config, report_data, tmp_path):
+    output_path = tmp_path / "report.html"
+    report_generator.save_report(report_config, report_data, str(output_path))
+    
+    expected = report_generator.generate_report(report_config, report_data)
+    assert "Test Security Report" in expected
+    assert output_path.read_text(encoding="utf-8") == expected
+    assert "".join(report_generator.iter_report(report_config, report_data)) == expected
+
+@pytest.fixture
+def chart_data(report_data):
+    return dict(
+        report_data,
+        vulnerabilities={"critical_vulnerabilities": ["CVE-1"], "high_vulnerabilities": ["CVE-2", "CVE-3"]},
+        stride={"stride_breakdown": {"Spoofing": 3, "Tampering": 2}},
+        dread={"detailed_scores": [{"threat_id": "inverter_001_spoofing", "damage": 8, "reproducibility": 6,
+                                    "exploitability": 7, "affected_users": 9, "discoverability": 5}]},
+        economic={"scenario_analysis": {"grid_outage": {"total_economic_impact": 250000.0}}},
+        compliance={"framework_results": {"AEMO_VPP": [{"compliance_score": 75.0}]}}
+    )
+
+def _render_chart_report(data, cpu_count, monkeypatch):
+    monkeypatch.setattr("src.report_generator.os.cpu_count", lambda: cpu_count)
+    config = ReportConfiguration(report_title="Chart Report", organization="Test Organization",
+                                 author="Test Author")
+    
+    with ReportGenerator() as generator:
+        report_html = generator.generate_report(config, data)
+        # One CPU renders in this process; more use the worker pool
+        assert (generator.html_builder._chart_executor is not None) == (cpu_count > 1)
+    assert generator.html_builder._chart_executor is None
+    return report_html
+
+@pytest.mark.parametrize("cpu_count", [1, 4])
+def test_build_report_renders_every_chart(cpu_count, chart_data, monkeypatch):
+    report_html = _render_chart_report(chart_data, cpu_count, monkeypatch)
+    images = re.findall(r'src="data:image/png;base64,([^"]*)"', report_html)
+    assert len(images) == len(REPORT_CHARTS) == 5
+    assert all(images)
+
+def test_build_report_same_with_and_without_worker_pool(chart_data, monkeypatch):
+    sequential = _render_chart_report(chart_data, 1, monkeypatch)
+    pooled = _render_chart_report(chart_data, 4, monkeypatch)
+    assert pooled == sequential
@@ -1,9 +1,32 @@
+import io
+import json
+
 import pytest
-from src.stride_threat_modeling import StrideModel
+from src.stride_threat_modeling import StrideModel, StrideResults, ThreatComponent
+
+RESULT_SECTIONS = ["system_summary", "stride_breakdown", "risk_distribution", "component_summary",
+                   "top_threats", "all_threats", "mitigation_recommendations"]
 
-def test_run_stride_analysis():
+@pytest.fixture(scope="module")
+def stride_results():
     model = StrideModel()
-    results = model.run_stride_analysis()
+    return model.run_stride_analysis()
+
+def _without_timestamp(results):
+    return {key: value for key, value in results.items() if key != "analysis_timestamp"}
+
+def _extra_component(model, component_id):
+    template = model.components[0]
+    return ThreatComponent(
+        id=component_id,
+        name=component_id,
+        component_type=template.component_type,
+        description="",
+        trust_boundary=template.trust_boundary
+    )
+
+def test_run_stride_analysis(stride_results):
+    results = stride_results
     assert isinstance(results, dict)
     assert "analysis_timestamp" in results
     assert "system_summary" in results
@@ -11,3 +34,87 @@ def test_run_stride_analysis():
     assert "risk_distribution" in results
     assert "top_threats" in results
     assert isinstance(results["top_threats"], list)
+
+def test_analyze_computes_sections_lazily():
+    results = StrideModel().analyze()
+    assert isinstance(results, StrideResults)
+    assert not any(section in vars(results) for section in RESULT_SECTIONS)
+    
+    summary = results.system_summary
+    assert "system_summary" in vars(results)
+    assert results.system_summary is summary
+    assert not any(section in vars(results) for section in RESULT_SECTIONS[1:])
+
+def test_analyze_to_dict_matches_run_stride_analysis():
+    model = StrideModel()
+    expected = model.run_stride_analysis()
+    results = model.analyze().to_dict()
+    assert list(results) == list(expected)
+    assert _without_timestamp(results) == _without_timestamp(expected)
+
+def test_analyze_sections_unaffected_by_reanalysis():
+    model = StrideModel()
+    expected = model.analyze().to_dict()
+    results = model.analyze()
+    
+    model.components.reverse()
+    model.add_component(_extra_component(model, "extra_component"))
+    model.analyze()
+    
+    # Sections read afterwards still describe the analysis the results came from
+    assert _without_timestamp(results.to_dict()) == _without_timestamp(expected)
+
+def test_run_stride_analysis_reuses_cached_result():
+    model = StrideModel()
+    results = model.run_stride_analysis()
+    assert model.run_stride_analysis() is results
+
+def test_run_stride_analysis_cache_invalidated_by_model_changes():
+    model = StrideModel()
+    results = model.run_stride_analysis()
+    
+    model.add_component(_extra_component(model, "extra_component"))
+    updated = model.run_stride_analysis()
+    assert updated is not results
+    assert updated["system_summary"]["total_components"] == results["system_summary"]["total_components"] + 1
+    
+    model.add_data_flow(model.data_flows[0])
+    assert model.run_stride_analysis() is not updated
+
+def test_run_stride_analysis_cache_invalidated_by_in_place_edits():
+    model = StrideModel()
+    results = model.run_stride_analysis()
+    
+    model.components[0].security_controls.append("multi_factor_authentication")
+    updated = model.run_stride_analysis()
+    assert updated is not results
+    
+    model.components[1] = _extra_component(model, "replacement_component")
+    replaced = model.run_stride_analysis()
+    assert replaced is not updated
+    assert "replacement_component" in replaced["component_summary"]
+
+def test_run_stride_analysis_cache_keyed_by_top_n():
+    model = StrideModel()
+    results = model.run_stride_analysis()
+    top_three = model.run_stride_analysis(top_n=3)
+    assert top_three is not results
+    assert len(top_three["top_threats"]) == 3
+    assert model.run_stride_analysis(top_n=3) is top_three
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_run_stride_analysis_to_stream_matches_run_stride_analysis(use_orjson, monkeypatch):
+    import src.stride_threat_modeling as stride_module
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(stride_module, "orjson", None)
+    
+    model = StrideModel()
+    expected = json.loads(json.dumps(model.run_stride_analysis()))
+    stream = io.BytesIO()
+    model.run_stride_analysis_to_stream(stream)
+    streamed = json.loads(stream.getvalue())
+    
+    assert list(streamed) == list(expected)
+    assert _without_timestamp(streamed) == _without_timestamp(expected)